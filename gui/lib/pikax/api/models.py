@@ -114,7 +114,6 @@ class BaseIDProcessor:
         total = len(item_ids)
         successes = []
         fails = []
-        pool = Pool(os.cpu_count())
 
         def process_item(itemid):
             try:
@@ -122,8 +121,13 @@ class BaseIDProcessor:
             except ArtworkError:
                 fails.append(itemid)
 
-        for index, item_id in enumerate(pool.imap_unordered(process_item, item_ids)):
-            util.print_progress(index + 1, total, title=texts.get('PROCESS_ID_TITLE'))
+        # resolved once outside the loop instead of once per completed id
+        progress_title = texts.get('PROCESS_ID_TITLE')
+        print_progress = util.print_progress
+        # context manager joins the workers, repeated batches must not pile up threads
+        with Pool(os.cpu_count()) as pool:
+            for index, item_id in enumerate(pool.imap_unordered(process_item, item_ids)):
+                print_progress(index + 1, total, title=progress_title)
         msg = texts.get('PROCESS_FINISHED_MESSAGE').format(total=total, successes=len(successes), fails=len(fails))
         util.print_done(msg)
         return successes, fails
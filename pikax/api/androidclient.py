@@ -316,7 +316,7 @@ class AndroidAPIClient(FunctionalBaseClient, DefaultAPIClient):
 
         return ids
 
-    def rank(self, limit=None, date=format(datetime.date.today(), '%Y%m%d'), content=params.Content.ILLUST,
+    def rank(self, limit=None, date=None, content=params.Content.ILLUST,
              rank_type=params.RankType.DAILY):
         return super().rank(limit=limit, date=date, content=content, rank_type=rank_type)
 
@@ -15,13 +15,20 @@ class Illust(Artwork):
 
     """
     _referer_url = 'https://www.pixiv.net/member_illust.php?mode=medium&illust_id='
-    _details_url = 'https://www.pixiv.net/ajax/illust/'
-    _headers = {
+    _details_base_url = 'https://www.pixiv.net/ajax/illust/'
+    _base_headers = {
         'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
                       'Chrome/75.0.3770.100 Safari/537.36'
     }
 
-    def __init__(self, illust_id):
+    __slots__ = ('_details', '_views', '_bookmarks', '_title', '_author', '_likes', '_tags',
+                 '__download_urls', '__original_url_template', '__comments', '__page_count',
+                 '_details_url', '_headers')
+
+    def __init__(self, illust_id, details=None):
+        # metadata in the shape of the ajax/illust body, skips the fetch in config when given
+        self._details = details
+
         # properties, set after generate details is called
         self._views = None
         self._bookmarks = None
@@ -39,15 +46,16 @@ class Illust(Artwork):
 
         # internal uses
         self.__page_count = None
-        self._details_url = Illust._details_url + str(illust_id)
-        self._headers = Illust._headers.copy()
+        self._details_url = Illust._details_base_url + str(illust_id)
+        self._headers = Illust._base_headers.copy()
         self._headers['referer'] = Illust._referer_url + str(illust_id)
         super().__init__(illust_id)
 
     def config(self):
         try:
-            illust_data = util.req(req_type='get', url=self._details_url, log_req=False).json()
-            illust_data = illust_data['body']
+            if self._details is None:
+                self._details = util.req(req_type='get', url=self._details_url, log_req=False).json()['body']
+            illust_data = self._details
 
             # properties
             self._views = illust_data['viewCount']
@@ -268,6 +268,9 @@ class DefaultRank:
             else:
                 raise RankError(f'content: {content} is not value of {params.Content}')
 
+        if date is None:
+            date = datetime.date.today()  # resolved per call, a module-level default would go stale
+
         if date:
             if isinstance(date, str):
                 rank_params['date'] = date
@@ -391,6 +394,9 @@ class DefaultAPIUser(APIUserInterface):
         'ko': u'변경'
     }
 
+    __slots__ = ('_id', '_session', '_account', '_name', 'title', 'description', 'follows',
+                 '_illust_ids', '_manga_ids')
+
     def __init__(self, user_id, session=None):
         self._id = user_id
         self._session = session
@@ -481,7 +487,7 @@ class DefaultAPIClient(APIPagesInterface, APIUserInterface, APIAccessInterface):
             return DefaultIllustSearch.search(keyword=keyword, search_type=search_type, match=match, sort=sort,
                                               search_range=search_range, limit=limit, session=self._session)
 
-    def rank(self, limit: int = None, date: Union[str, datetime.date] = format(datetime.date.today(), '%Y%m%d'),
+    def rank(self, limit: int = None, date: Union[str, datetime.date] = None,
              content: params.Content = params.Content.ILLUST, rank_type: params.RankType = params.RankType.DAILY) -> \
             List[int]:
         return DefaultRank.rank(limit=limit, date=date, content=content, rank_type=rank_type)
@@ -1,14 +1,21 @@
 import datetime
 import enum
 import os
-from multiprocessing.dummy import Pool
-from typing import List, Tuple, Union, Type, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Union, Type, Any
 
-from .. import params, util
+from .. import params, settings, util
 from ..exceptions import ArtworkError
 
+# shared across all id processing, workload is network-bound so workers exceed cpu count,
+# reusing one executor keeps connections warm instead of re-creating threads per batch
+_ID_PROCESSOR_WORKERS = settings.ID_PROCESSOR_WORKERS or os.cpu_count() * 4
+_id_processor_executor = ThreadPoolExecutor(max_workers=_ID_PROCESSOR_WORKERS)
+
 
 class APIUserInterface:
+    __slots__ = ()
 
     def bookmarks(self, limit: int = None, bookmark_type: params.BookmarkType = params.BookmarkType.ILLUST_OR_MANGA,
                   restrict: params.Restrict = params.Restrict.PUBLIC) -> List[int]:
@@ -45,11 +52,13 @@ class APIPagesInterface:
     def rank(self,
              rank_type: params.RankType = params.RankType.DAILY,
              content: params.Content = params.Content.ILLUST,
-             date: Union[str, datetime.date] = format(datetime.date.today(), '%Y%m%d'),
+             date: Union[str, datetime.date] = None,  # default today, resolved at call time
              limit: int = None) -> List[int]: raise NotImplementedError
 
 
 class Artwork:
+    # slots keep per-instance memory down, large batches hold thousands of artworks
+    __slots__ = ('id',)
 
     def __init__(self, artwork_id):
         self.id = artwork_id
@@ -94,35 +103,63 @@ class BaseIDProcessor:
             params.ProcessType.ILLUST: self.process_illusts,
         }
 
-    def process_illusts(self, ids: List[int]) -> Tuple[List[Artwork], List[int]]:
+    def process_illusts(self, ids: List[int], details: Dict[int, dict] = None) -> Tuple[List[Artwork], List[int]]:
         raise NotImplementedError
 
-    def process_mangas(self, ids: List[int]) -> Tuple[List[Artwork], List[int]]:
+    def process_mangas(self, ids: List[int], details: Dict[int, dict] = None) -> Tuple[List[Artwork], List[int]]:
         raise NotImplementedError
 
-    def process(self, ids: List[int], process_type: params.ProcessType) -> Tuple[List[Artwork], List[int]]:
-        if not params.ProcessType.is_valid(process_type):
+    def process(self, ids: List[int], process_type: params.ProcessType, details: Dict[int, dict] = None) \
+            -> Tuple[List[Artwork], List[int]]:
+        try:  # dispatch directly, the dict lookup already rejects anything that is not a process type
+            process_function = self.type_to_function[process_type]
+        except (KeyError, TypeError):
             from ..exceptions import ProcessError
             raise ProcessError(f'process type: {process_type} is not type of {params.ProcessType}')
 
-        return self.type_to_function[process_type](ids)
+        return process_function(ids, details=details)
 
     @staticmethod  # param cls is pass in as argument
-    def _general_processor(cls: Type[Artwork], item_ids: List[int]) -> Tuple[List[Artwork], List[int]]:
+    def _general_processor(cls: Type[Artwork], item_ids: List[int], details: Dict[int, dict] = None) \
+            -> Tuple[List[Artwork], List[int]]:
         util.log('Processing artwork ids', start=os.linesep, inform=True)
         total = len(item_ids)
         successes = []
         fails = []
-        pool = Pool()
-
-        def process_item(itemid):
-            try:
-                successes.append(cls(itemid))
-            except ArtworkError:
-                fails.append(itemid)
 
-        for index, item_id in enumerate(pool.imap_unordered(process_item, item_ids)):
-            util.print_progress(index + 1, total)
+        def process_chunk(chunk):
+            results = []
+            for itemid in chunk:
+                try:
+                    # prefetched metadata lets the artwork skip its own detail request
+                    if details and itemid in details:
+                        results.append((True, cls(itemid, details=details[itemid])))
+                    else:
+                        results.append((True, cls(itemid)))
+                except ArtworkError:
+                    results.append((False, itemid))
+            return results
+
+        # submit ids in chunks to amortize per-task dispatch overhead,
+        # ~4 chunks per worker keeps the load balanced across threads
+        chunksize = max(1, total // (_ID_PROCESSOR_WORKERS * 4))
+        chunks = [item_ids[i:i + chunksize] for i in range(0, total, chunksize)]
+
+        # aggregate in the main thread so workers never touch shared lists,
+        # the per-id calls are bound to locals to skip module attribute lookups in the loop
+        print_progress = util.print_progress
+        monotonic = time.monotonic
+        done = 0
+        last_print = 0.0
+        for chunk_results in _id_processor_executor.map(process_chunk, chunks):
+            for ok, value in chunk_results:
+                (successes if ok else fails).append(value)
+                done += 1
+                # terminal writes block, cap progress updates at ~20 per second
+                now = monotonic()
+                if now - last_print >= 0.05 or done == total:
+                    print_progress(done, total)
+                    last_print = now
         msg = f'expected: {total} | success: {len(successes)} | failed: {len(fails)}'
         util.print_done(msg)
         return successes, fails
@@ -1,9 +1,13 @@
+import copy
 import datetime
+import json
 import os
 import pickle
 import re
 from typing import Union, List
 
+import requests
+
 from .. import params
 from .. import util, settings
 from ..api.defaultclient import DefaultAPIClient, DefaultAPIUser
@@ -11,31 +15,56 @@ from ..exceptions import ReqException, LoginError, APIUserError
 
 __all__ = ['WebAPIClient']
 
+# compiled once, matched against raw bytes so the login page is never fully decoded,
+# post key is a hex token so the bounded char class keeps worst case a linear scan
+_post_key_regex = re.compile(rb'post_key"\s*value="([A-Fa-f0-9]{16,64})"')
+
+# (path, mtime) -> parsed cookie jar, so repeated logins in one process skip the disk read
+_cookies_cache = {}
+
 
 class BaseClient:
     _login_check_url = 'https://www.pixiv.net/touch/ajax/user/self/status'
+    _session_cookie_name = 'PHPSESSID'
 
     def __init__(self):
         self._session = util.new_session()
         self.cookies_file = settings.COOKIES_FILE
+        self._logged = False
 
     def _check_is_logged(self):
+        if self._logged:
+            return True
+
+        # without pixiv's session cookie there is no point asking the server
+        if self._session_cookie_name not in self._session.cookies:
+            return False
+
         try:
             status_json = util.req(url=self._login_check_url, session=self._session).json()
-            return status_json['body']['user_status']['is_logged_in']
+            self._logged = bool(status_json['body']['user_status']['is_logged_in'])
+            return self._logged
         except ReqException:
             util.log('Checking Failed')
             return False
 
     def _save_cookies(self):
+        util.log(f'Saving cookies to local file: {self.cookies_file}')
 
-        if os.path.isfile(self.cookies_file):
-            util.log(f'Rewriting local cookie file: {self.cookies_file}')
-        else:
-            util.log(f'Saving cookies to local file: {self.cookies_file}')
+        # write to a temp file then rename, a crash mid-write never leaves a truncated cookie file
+        tmp_file = self.cookies_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(requests.utils.dict_from_cookiejar(self._session.cookies), file)
+        os.replace(tmp_file, self.cookies_file)
 
-        with open(self.cookies_file, 'wb') as file:
-            pickle.dump(self._session.cookies, file)
+    def _load_cookies_file(self):
+        try:
+            with open(self.cookies_file, 'r', encoding='utf-8') as file:
+                return requests.utils.cookiejar_from_dict(json.load(file))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # cookie files written by older versions were pickled jars
+            with open(self.cookies_file, 'rb') as file:
+                return pickle.load(file)
 
     def _login(self, *args):
         raise NotImplementedError
@@ -63,12 +92,21 @@ class AccountClient(BaseClient):
         util.log('Sending requests to attempt login ...')
 
         try:
-            util.req(req_type='post', session=self._session, url=self._login_url, data=data, params=login_params)
+            res = util.req(req_type='post', session=self._session, url=self._login_url, data=data,
+                           params=login_params)
         except ReqException as e:
             raise LoginError(f'Failed to send login request: {e}')
 
         util.log('Login request sent to Pixiv')
-        if self._check_is_logged():
+
+        # the login response already tells whether login was accepted,
+        # only fall back to a status round-trip when its shape is unexpected
+        try:
+            logged = bool(res.json()['body']['success'])
+        except (ValueError, KeyError):
+            logged = self._check_is_logged()
+
+        if logged:
             self._save_cookies()
         else:
             raise LoginError('Login Request is not accepted')
@@ -76,7 +114,7 @@ class AccountClient(BaseClient):
     def _get_postkey(self):
         try:
             pixiv_login_page = util.req(session=self._session, url=self._post_key_url)
-            post_key = re.search(r'post_key" value="(.*?)"', pixiv_login_page.text).group(1)
+            post_key = _post_key_regex.search(pixiv_login_page.content).group(1).decode()
             util.log(f'Post key successfully retrieved: {post_key}')
             return post_key
         except (ReqException, AttributeError) as e:
@@ -105,16 +143,20 @@ class CookiesClient(BaseClient):
         # cookies exists
         util.log(f'Cookie file found: {self.cookies_file}, attempt to login with local cookie')
         try:
-            with open(self.cookies_file, 'rb') as f:
-                local_cookies = pickle.load(f)
-                self._session.cookies = local_cookies
+            cache_key = (self.cookies_file, os.path.getmtime(self.cookies_file))
+            local_cookies = _cookies_cache.get(cache_key)
+            if local_cookies is None:
+                local_cookies = self._load_cookies_file()
+                _cookies_cache[cache_key] = local_cookies
+            self._session.cookies = copy.deepcopy(local_cookies)  # sessions must not share one jar
             if self._check_is_logged():
                 util.log('Logged in successfully with local cookies', inform=True)
                 return
             else:
+                _cookies_cache.pop(cache_key, None)
                 os.remove(self.cookies_file)
                 util.log('Removed outdated cookies', inform=True)
-        except pickle.UnpicklingError as e:
+        except (pickle.UnpicklingError, ValueError) as e:
             os.remove(self.cookies_file)
             util.log('Removed corrupted cookies file, message: {}'.format(e))
 
@@ -153,18 +195,16 @@ class CookiesClient(BaseClient):
         raise LoginError('Failed login with user cookies')
 
     def _change_to_new_cookies(self, user_cookies):
-        # remove old cookies
-        for old_cookie in self._session.cookies.keys():
-            self._session.cookies.__delitem__(old_cookie)
-
-        # add new cookies
         try:
-            for new_cookie in user_cookies.split(';'):
-                name, value = new_cookie.split('=', 1)
-                self._session.cookies[name] = value
+            new_cookies = dict(cookie.split('=', 1) for cookie in user_cookies.split(';'))
         except ValueError as e:
             raise LoginError(f'Cookies given is invalid, please try again | {e}') from e
 
+        # one clear + one rebuild instead of deleting and re-inserting keys one at a time
+        self._logged = False  # any cached login status belongs to the old cookies
+        self._session.cookies.clear()
+        self._session.cookies.update(requests.utils.cookiejar_from_dict(new_cookies))
+
 
 class BookmarkHandler:
     _bookmark_url = 'https://www.pixiv.net/ajax/user/{user_id}/illusts/bookmarks?'
@@ -254,6 +294,7 @@ class CreationHandler:
 
 
 class WebAPIUser(DefaultAPIUser):
+    __slots__ = ()
 
     def bookmarks(self, limit: int = None, bookmark_type: params.Type = params.Type.ILLUST,
                   restrict: params.Restrict = params.Restrict.PUBLIC) -> List[int]:
@@ -266,6 +307,7 @@ class WebAPIClient(AccountClient, CookiesClient, DefaultAPIClient):
 
     def __init__(self, username, password):
         super().__init__()
+        self._visits_cache = {}
         try:
             AccountClient._login(self, username, password)
         except LoginError:
@@ -304,13 +346,18 @@ class WebAPIClient(AccountClient, CookiesClient, DefaultAPIClient):
         return super().search(keyword=keyword, search_type=search_type, match=match, sort=sort,
                               search_range=search_range, limit=limit)
 
-    def rank(self, limit: int = None, date: Union[str, datetime.date] = format(datetime.date.today(), '%Y%m%d'),
+    def rank(self, limit: int = None, date: Union[str, datetime.date] = None,
              content: params.Content = params.Content.ILLUST, rank_type: params.RankType = params.RankType.DAILY) -> \
             List[int]:
         return super().rank(rank_type=rank_type, date=date, content=content, limit=limit)
 
     def visits(self, user_id: int):
-        return WebAPIUser(user_id=user_id, session=self._session)
+        # configuring a user costs two requests, reuse users already visited this session
+        user = self._visits_cache.get(user_id)
+        if user is None:
+            user = WebAPIUser(user_id=user_id, session=self._session)
+            self._visits_cache[user_id] = user
+        return user
 
     @property
     def account(self):
@@ -9,12 +9,12 @@ class DefaultIDProcessor(BaseIDProcessor):
     def __init__(self):
         super().__init__()
 
-    def process_mangas(self, ids):
+    def process_mangas(self, ids, details=None):
         # they are essentially the same, just illust with more pages
-        return self.process_illusts(ids)
+        return self.process_illusts(ids, details=details)
 
-    def process_illusts(self, ids):
-        return self._general_processor(Illust, ids)
+    def process_illusts(self, ids, details=None):
+        return self._general_processor(Illust, ids, details=details)
 
 
 def test():
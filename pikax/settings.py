@@ -88,6 +88,13 @@ None means download all pages
 """
 MAX_PAGES_PER_ARTWORK = None
 
+"""
+number of worker threads used when processing artwork ids,
+the work is network-bound so this may well exceed cpu count,
+None means os.cpu_count() * 4
+"""
+ID_PROCESSOR_WORKERS = None
+
 """
 file for saving cookies
 """
@@ -260,7 +260,18 @@ def print_json(json_obj):
 
 
 def new_session():
-    return requests.Session()
+    session = requests.Session()
+    # pool sized for the concurrent id-processing threads so connections are reused
+    # instead of discarded, with backoff retries for pixiv's transient errors
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=128,
+        max_retries=urllib3.util.Retry(total=3, backoff_factor=0.3,
+                                       status_forcelist=(429, 500, 502, 503, 504),
+                                       allowed_methods=frozenset(('GET', 'POST'))))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class Printer(object):